@@ -1,14 +1,17 @@
+import asyncio
+import functools
 import os
 import re
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
 
-import requests
+import httpx
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from starlette.requests import Request
+from pydantic import BaseModel, EmailStr
 
 from google_workspace_mcp import GoogleWorkspaceMCP, WorkspaceConfig
 
@@ -20,9 +23,10 @@ class ChatConfig:
     gemini_api_key: str
     gemini_model: str
 
-    @classmethod
-    def from_env(cls) -> "ChatConfig":
-        return cls(
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def from_env() -> "ChatConfig":
+        return ChatConfig(
             openai_api_key=os.getenv("OPENAI_API_KEY", ""),
             openai_model=os.getenv("OPENAI_MODEL", ""),
             gemini_api_key=os.getenv("GEMINI_API_KEY", ""),
@@ -30,117 +34,304 @@ class ChatConfig:
         )
 
 
-app = FastAPI()
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+class ChatIn(BaseModel):
+    message: str
+    provider: Literal["openai", "gemini"] = "openai"
 
 
-@app.get("/", response_class=HTMLResponse)
-def index(request: Request) -> HTMLResponse:
-    return templates.TemplateResponse("index.html", {"request": request})
+class ChatBatchIn(BaseModel):
+    messages: List[str]
+    provider: Literal["openai", "gemini"] = "openai"
 
 
-SEND_EMAIL_PATTERN = re.compile(
-    r"send email"
-    r"(?:\\s+to\\s+(?P<to>[^\\s]+))?"
-    r"(?:\\s+subject\\s+(?P<subject>.+?))?"
-    r"(?:\\s+(?:body|message)\\s+(?P<body>.+))?$",
-    re.IGNORECASE | re.DOTALL,
-)
+class SendEmailIn(BaseModel):
+    to: EmailStr
+    subject: str
+    body: str
+
+
+class DeleteEmailIn(BaseModel):
+    message_id: str
+
+
+_HASHED_ASSET = re.compile(r"\.[0-9a-f]{8,}\.")
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks content-hashed assets as immutable."""
+
+    def file_response(self, *args: Any, **kwargs: Any):
+        response = super().file_response(*args, **kwargs)
+        scope = kwargs.get("scope") or args[2]
+        if _HASHED_ASSET.search(scope["path"]):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
 
-DELETE_EMAIL_PATTERN = re.compile(
-    r"delete email\\s+(?P<message_id>[\\w-]+)", re.IGNORECASE
+client = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
 )
 
-LIST_EMAILS_PATTERN = re.compile(r"list emails(?:\\s+(?P<query>.+))?$", re.IGNORECASE)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    await client.aclose()
 
-def parse_chat_intent(message: str) -> Optional[Dict[str, str]]:
-    send_match = SEND_EMAIL_PATTERN.search(message)
-    if send_match:
-        subject = send_match.group("subject") or ""
-        body = send_match.group("body") or ""
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+mcp = GoogleWorkspaceMCP(WorkspaceConfig.from_env())
+app.mount("/static", CachedStaticFiles(directory="static"), name="static")
+
+with open("templates/index.html", "rb") as _index_file:
+    _INDEX_HTML = _index_file.read()
+
+
+@app.get("/", response_class=HTMLResponse)
+def index() -> HTMLResponse:
+    return HTMLResponse(content=_INDEX_HTML)
+
+
+INTENT_PATTERN = re.compile(
+    r"(?P<send>send email"
+    r"(?:\s+to\s+(?P<send_to>\S+))?"
+    r"(?:\s+subject\s+(?P<send_subject>.+?))?"
+    r"(?:\s+(?:body|message)\s+(?P<send_body>.+))?$)"
+    r"|(?P<delete>delete email\s+(?P<delete_id>[\w-]+))"
+    r"|(?P<list>list emails(?:\s+(?P<list_query>.+))?$)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+def _parse_chat_intent(message: str) -> Optional[Dict[str, str]]:
+    head = message[:32].lower()
+    if not (
+        "send email" in head or "delete email" in head or "list emails" in head
+    ):
+        return None
+    match = INTENT_PATTERN.search(message)
+    if not match:
+        return None
+    if match.group("send") is not None:
+        subject = match.group("send_subject") or ""
+        body = match.group("send_body") or ""
         if not body:
-            to_end = send_match.end("to") if send_match.group("to") else None
+            to_end = match.end("send_to") if match.group("send_to") else None
             remainder = message[to_end:].strip() if to_end else ""
             if remainder.lower().startswith("subject"):
                 remainder = remainder[len("subject") :].strip()
             body = remainder
         return {
             "intent": "send_email",
-            "to": (send_match.group("to") or "").strip(),
+            "to": (match.group("send_to") or "").strip(),
             "subject": subject.strip(),
             "body": body.strip(),
         }
-    delete_match = DELETE_EMAIL_PATTERN.search(message)
-    if delete_match:
+    if match.group("delete") is not None:
         return {
             "intent": "delete_email",
-            "message_id": delete_match.group("message_id").strip(),
-        }
-    list_match = LIST_EMAILS_PATTERN.search(message.strip())
-    if list_match:
-        query = list_match.group("query")
-        return {
-            "intent": "list_emails",
-            "query": query.strip() if query else "",
+            "message_id": match.group("delete_id").strip(),
         }
-    return None
+    query = match.group("list_query")
+    return {
+        "intent": "list_emails",
+        "query": query.strip() if query else "",
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_chat_intent_cached(message: str) -> Optional[Tuple[Tuple[str, str], ...]]:
+    intent = _parse_chat_intent(message)
+    return tuple(intent.items()) if intent is not None else None
 
 
-def build_chat_response(provider: str, message: str, config: ChatConfig) -> Dict[str, Any]:
-    provider = provider.lower()
-    if provider == "gemini":
+def parse_chat_intent(message: str) -> Optional[Dict[str, str]]:
+    fields = _parse_chat_intent_cached(message)
+    return dict(fields) if fields is not None else None
+
+
+_GEMINI_NAMES = frozenset({"gemini", "Gemini", "GEMINI"})
+_GEMINI_URL = (
+    "https://generativelanguage.googleapis.com/v1beta/models/"
+    f"{ChatConfig.from_env().gemini_model}:generateContent"
+)
+_GEMINI_STREAM_URL = (
+    "https://generativelanguage.googleapis.com/v1beta/models/"
+    f"{ChatConfig.from_env().gemini_model}:streamGenerateContent"
+)
+
+
+async def build_chat_response(
+    provider: str, message: str, config: ChatConfig
+) -> Dict[str, Any]:
+    if provider in _GEMINI_NAMES:
         if not config.gemini_api_key:
             raise HTTPException(status_code=400, detail="GEMINI_API_KEY is not set.")
         if not config.gemini_model:
             raise HTTPException(status_code=400, detail="GEMINI_MODEL is not set.")
-        return call_gemini(config.gemini_api_key, config.gemini_model, message)
+        return await call_gemini(config.gemini_api_key, message)
     if not config.openai_api_key:
         raise HTTPException(status_code=400, detail="OPENAI_API_KEY is not set.")
     if not config.openai_model:
         raise HTTPException(status_code=400, detail="OPENAI_MODEL is not set.")
-    return call_openai(config.openai_api_key, config.openai_model, message)
+    return await call_openai(config.openai_api_key, config.openai_model, message)
 
 
-def call_openai(api_key: str, model: str, message: str) -> Dict[str, Any]:
-    response = requests.post(
-        "https://api.openai.com/v1/chat/completions",
-        headers={"Authorization": f"Bearer {api_key}"},
-        json={
+async def call_openai(api_key: str, model: str, message: str) -> Dict[str, Any]:
+    payload = orjson.dumps(
+        {
             "model": model,
             "messages": [{"role": "user", "content": message}],
             "temperature": 0.3,
+        }
+    )
+    response = await client.post(
+        "https://api.openai.com/v1/chat/completions",
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
         },
-        timeout=30,
     )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     content = data["choices"][0]["message"]["content"]
     return {"provider": "openai", "reply": content}
 
 
-def call_gemini(api_key: str, model: str, message: str) -> Dict[str, Any]:
-    url = (
-        "https://generativelanguage.googleapis.com/v1beta/models/"
-        f"{model}:generateContent"
+async def call_gemini(api_key: str, message: str) -> Dict[str, Any]:
+    payload = orjson.dumps(
+        {"contents": [{"parts": [{"text": message}]}], "temperature": 0.3}
     )
-    response = requests.post(
-        url,
+    response = await client.post(
+        _GEMINI_URL,
         params={"key": api_key},
-        json={"contents": [{"parts": [{"text": message}]}], "temperature": 0.3},
-        timeout=30,
+        content=payload,
+        headers={"Content-Type": "application/json"},
     )
     response.raise_for_status()
-    data = response.json()
+    data = orjson.loads(response.content)
     reply = data["candidates"][0]["content"]["parts"][0]["text"]
     return {"provider": "gemini", "reply": reply}
 
 
+async def _start_stream(request: httpx.Request) -> httpx.Response:
+    response = await client.send(request, stream=True)
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError:
+        await response.aclose()
+        raise
+    return response
+
+
+async def start_openai_stream(api_key: str, model: str, message: str) -> httpx.Response:
+    payload = orjson.dumps(
+        {
+            "model": model,
+            "messages": [{"role": "user", "content": message}],
+            "temperature": 0.3,
+            "stream": True,
+        }
+    )
+    request = client.build_request(
+        "POST",
+        "https://api.openai.com/v1/chat/completions",
+        content=payload,
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {api_key}",
+        },
+    )
+    return await _start_stream(request)
+
+
+async def start_gemini_stream(api_key: str, message: str) -> httpx.Response:
+    payload = orjson.dumps(
+        {"contents": [{"parts": [{"text": message}]}], "temperature": 0.3}
+    )
+    request = client.build_request(
+        "POST",
+        _GEMINI_STREAM_URL,
+        params={"key": api_key, "alt": "sse"},
+        content=payload,
+        headers={"Content-Type": "application/json"},
+    )
+    return await _start_stream(request)
+
+
+async def relay_openai_stream(response: httpx.Response) -> AsyncIterator[str]:
+    try:
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            chunk = line[len("data: ") :]
+            if chunk == "[DONE]":
+                break
+            data = orjson.loads(chunk)
+            delta = data["choices"][0].get("delta", {}).get("content")
+            if delta:
+                yield "data: " + orjson.dumps({"delta": delta}).decode() + "\n\n"
+    finally:
+        await response.aclose()
+
+
+async def relay_gemini_stream(response: httpx.Response) -> AsyncIterator[str]:
+    try:
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = orjson.loads(line[len("data: ") :])
+            parts = data.get("candidates", [{}])[0].get("content", {}).get("parts", [])
+            for part in parts:
+                text = part.get("text")
+                if text:
+                    yield "data: " + orjson.dumps({"delta": text}).decode() + "\n\n"
+    finally:
+        await response.aclose()
+
+
+@app.post("/api/chat/stream")
+async def chat_stream(payload: ChatIn) -> StreamingResponse:
+    message = payload.message.strip()
+    provider = payload.provider
+    if not message:
+        raise HTTPException(status_code=400, detail="Message is required.")
+    config = ChatConfig.from_env()
+    try:
+        if provider in _GEMINI_NAMES:
+            if not config.gemini_api_key:
+                raise HTTPException(status_code=400, detail="GEMINI_API_KEY is not set.")
+            if not config.gemini_model:
+                raise HTTPException(status_code=400, detail="GEMINI_MODEL is not set.")
+            response = await start_gemini_stream(config.gemini_api_key, message)
+            generator = relay_gemini_stream(response)
+        else:
+            if not config.openai_api_key:
+                raise HTTPException(status_code=400, detail="OPENAI_API_KEY is not set.")
+            if not config.openai_model:
+                raise HTTPException(status_code=400, detail="OPENAI_MODEL is not set.")
+            response = await start_openai_stream(
+                config.openai_api_key, config.openai_model, message
+            )
+            generator = relay_openai_stream(response)
+    except httpx.HTTPError as exc:
+        return ORJSONResponse(
+            status_code=502,
+            content={
+                "error": "Upstream chat provider request failed.",
+                "detail": str(exc),
+            },
+        )
+    return StreamingResponse(generator, media_type="text/event-stream")
+
+
 @app.post("/api/chat")
-def chat(payload: Dict[str, Any]) -> Dict[str, Any]:
-    message = str(payload.get("message", "")).strip()
-    provider = str(payload.get("provider", "openai"))
+async def chat(payload: ChatIn) -> Dict[str, Any]:
+    message = payload.message.strip()
+    provider = payload.provider
     if not message:
         raise HTTPException(status_code=400, detail="Message is required.")
     try:
@@ -161,32 +352,57 @@ def chat(payload: Dict[str, Any]) -> Dict[str, Any]:
                         + "."
                     )
                 }
-            mcp = GoogleWorkspaceMCP(WorkspaceConfig.from_env())
             return {
                 "reply": "Email request received.",
-                "action": mcp.send_email(
+                "action": await mcp.send_email(
                     to_address=intent["to"],
                     subject=intent["subject"],
                     body=intent["body"],
                 ),
             }
         if intent and intent["intent"] == "delete_email":
-            mcp = GoogleWorkspaceMCP(WorkspaceConfig.from_env())
             return {
                 "reply": "Delete request received.",
-                "action": mcp.delete_email(message_id=intent["message_id"]),
+                "action": await mcp.delete_email(message_id=intent["message_id"]),
             }
         if intent and intent["intent"] == "list_emails":
-            mcp = GoogleWorkspaceMCP(WorkspaceConfig.from_env())
             return {
                 "reply": "Listing emails.",
-                "action": mcp.list_emails(query=intent["query"]),
+                "action": await mcp.list_emails(query=intent["query"]),
             }
-        return build_chat_response(provider, message, ChatConfig.from_env())
+        return await build_chat_response(provider, message, ChatConfig.from_env())
+    except HTTPException as exc:
+        return ORJSONResponse(status_code=exc.status_code, content={"error": exc.detail})
+    except httpx.HTTPError as exc:
+        return ORJSONResponse(
+            status_code=502,
+            content={
+                "error": "Upstream chat provider request failed.",
+                "detail": str(exc),
+            },
+        )
+
+
+@app.post("/api/chat/batch")
+async def chat_batch(payload: ChatBatchIn) -> Dict[str, Any]:
+    if not payload.messages:
+        raise HTTPException(status_code=400, detail="messages must be a non-empty list.")
+    messages = [message.strip() for message in payload.messages]
+    if not all(messages):
+        raise HTTPException(status_code=400, detail="Message is required.")
+    config = ChatConfig.from_env()
+    try:
+        replies = await asyncio.gather(
+            *(
+                build_chat_response(payload.provider, message, config)
+                for message in messages
+            )
+        )
+        return {"replies": list(replies)}
     except HTTPException as exc:
-        return JSONResponse(status_code=exc.status_code, content={"error": exc.detail})
-    except requests.RequestException as exc:
-        return JSONResponse(
+        return ORJSONResponse(status_code=exc.status_code, content={"error": exc.detail})
+    except httpx.HTTPError as exc:
+        return ORJSONResponse(
             status_code=502,
             content={
                 "error": "Upstream chat provider request failed.",
@@ -196,25 +412,19 @@ def chat(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @app.post("/api/email/send")
-def send_email(payload: Dict[str, Any]) -> Dict[str, Any]:
-    config = WorkspaceConfig.from_env()
-    mcp = GoogleWorkspaceMCP(config)
-    return mcp.send_email(
-        to_address=str(payload.get("to", "")),
-        subject=str(payload.get("subject", "")),
-        body=str(payload.get("body", "")),
+async def send_email(payload: SendEmailIn) -> Dict[str, Any]:
+    return await mcp.send_email(
+        to_address=payload.to,
+        subject=payload.subject,
+        body=payload.body,
     )
 
 
 @app.post("/api/email/delete")
-def delete_email(payload: Dict[str, Any]) -> Dict[str, Any]:
-    config = WorkspaceConfig.from_env()
-    mcp = GoogleWorkspaceMCP(config)
-    return mcp.delete_email(message_id=str(payload.get("message_id", "")))
+async def delete_email(payload: DeleteEmailIn) -> Dict[str, Any]:
+    return await mcp.delete_email(message_id=payload.message_id)
 
 
 @app.get("/api/email/list")
-def list_emails(query: Optional[str] = None) -> Dict[str, Any]:
-    config = WorkspaceConfig.from_env()
-    mcp = GoogleWorkspaceMCP(config)
-    return mcp.list_emails(query=query)
+async def list_emails(query: Optional[str] = None) -> Dict[str, Any]:
+    return await mcp.list_emails(query=query)
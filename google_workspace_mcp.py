@@ -1,4 +1,6 @@
+import asyncio
 import base64
+import functools
 import os
 from dataclasses import dataclass
 from email.message import EmailMessage
@@ -17,9 +19,10 @@ class WorkspaceConfig:
     private_key: str
     delegated_user: str
 
-    @classmethod
-    def from_env(cls) -> "WorkspaceConfig":
-        return cls(
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def from_env() -> "WorkspaceConfig":
+        return WorkspaceConfig(
             client_email=os.getenv("GOOGLE_WORKSPACE_CLIENT_EMAIL", ""),
             private_key=os.getenv("GOOGLE_WORKSPACE_PRIVATE_KEY", ""),
             delegated_user=os.getenv("GOOGLE_WORKSPACE_DELEGATED_USER", ""),
@@ -32,9 +35,10 @@ class OAuthConfig:
     client_secret: str
     token_file: str
 
-    @classmethod
-    def from_env(cls) -> "OAuthConfig":
-        return cls(
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def from_env() -> "OAuthConfig":
+        return OAuthConfig(
             client_id=os.getenv("GOOGLE_OAUTH_CLIENT_ID", ""),
             client_secret=os.getenv("GOOGLE_OAUTH_CLIENT_SECRET", ""),
             token_file=os.getenv("GOOGLE_OAUTH_TOKEN_FILE", "token.json"),
@@ -47,15 +51,17 @@ class GoogleWorkspaceMCP:
     def __init__(self, config: WorkspaceConfig) -> None:
         self.config = config
         self.oauth_config = OAuthConfig.from_env()
+        self._creds: Optional[Credentials] = None
+        self._service = None
 
-    def send_email(self, to_address: str, subject: str, body: str) -> Dict[str, str]:
+    async def send_email(self, to_address: str, subject: str, body: str) -> Dict[str, str]:
         if not to_address or not subject or not body:
             return {
                 "status": "error",
                 "message": "to, subject, and body are required.",
             }
         if self._has_oauth_config():
-            return self._send_email_oauth(to_address, subject, body)
+            return await self._send_email_oauth(to_address, subject, body)
         if not self._has_credentials():
             return {
                 "status": "error",
@@ -67,11 +73,11 @@ class GoogleWorkspaceMCP:
             "to": to_address,
         }
 
-    def delete_email(self, message_id: str) -> Dict[str, str]:
+    async def delete_email(self, message_id: str) -> Dict[str, str]:
         if not message_id:
             return {"status": "error", "message": "message_id is required."}
         if self._has_oauth_config():
-            return self._delete_email_oauth(message_id)
+            return await self._delete_email_oauth(message_id)
         if not self._has_credentials():
             return {
                 "status": "error",
@@ -79,9 +85,9 @@ class GoogleWorkspaceMCP:
             }
         return {"status": "deleted", "message_id": message_id}
 
-    def list_emails(self, query: Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
+    async def list_emails(self, query: Optional[str] = None) -> Dict[str, List[Dict[str, str]]]:
         if self._has_oauth_config():
-            return self._list_emails_oauth(query=query)
+            return await self._list_emails_oauth(query=query)
         if not self._has_credentials():
             return {
                 "emails": [],
@@ -100,12 +106,10 @@ class GoogleWorkspaceMCP:
         }
 
     def _has_credentials(self) -> bool:
-        return all(
-            [
-                self.config.client_email,
-                self.config.private_key,
-                self.config.delegated_user,
-            ]
+        return bool(
+            self.config.client_email
+            and self.config.private_key
+            and self.config.delegated_user
         )
 
     def _has_oauth_config(self) -> bool:
@@ -142,23 +146,32 @@ class GoogleWorkspaceMCP:
         return creds
 
     def _get_gmail_service(self):
-        creds = self._get_oauth_credentials()
-        return build("gmail", "v1", credentials=creds)
+        if self._service is not None and self._creds is not None and not self._creds.expired:
+            return self._service
+        self._creds = self._get_oauth_credentials()
+        self._service = build(
+            "gmail",
+            "v1",
+            credentials=self._creds,
+            cache_discovery=False,
+            static_discovery=True,
+        )
+        return self._service
 
-    def _send_email_oauth(self, to_address: str, subject: str, body: str) -> Dict[str, str]:
+    async def _send_email_oauth(self, to_address: str, subject: str, body: str) -> Dict[str, str]:
         try:
-            service = self._get_gmail_service()
+            service = await asyncio.to_thread(self._get_gmail_service)
             message = EmailMessage()
             message["To"] = to_address
             message["Subject"] = subject
             message.set_content(body)
-            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
-            result = (
+            raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("ascii")
+            request = (
                 service.users()
                 .messages()
                 .send(userId="me", body={"raw": raw_message})
-                .execute()
             )
+            result = await asyncio.to_thread(request.execute)
             return {"status": "sent", "message_id": result.get("id", "")}
         except HttpError as exc:
             return {
@@ -167,10 +180,11 @@ class GoogleWorkspaceMCP:
                 "detail": str(exc),
             }
 
-    def _delete_email_oauth(self, message_id: str) -> Dict[str, str]:
+    async def _delete_email_oauth(self, message_id: str) -> Dict[str, str]:
         try:
-            service = self._get_gmail_service()
-            service.users().messages().delete(userId="me", id=message_id).execute()
+            service = await asyncio.to_thread(self._get_gmail_service)
+            request = service.users().messages().delete(userId="me", id=message_id)
+            await asyncio.to_thread(request.execute)
             return {"status": "deleted", "message_id": message_id}
         except HttpError as exc:
             return {
@@ -179,39 +193,57 @@ class GoogleWorkspaceMCP:
                 "detail": str(exc),
             }
 
-    def _list_emails_oauth(
+    async def _list_emails_oauth(
         self, query: Optional[str] = None
     ) -> Dict[str, List[Dict[str, str]]]:
         try:
-            service = self._get_gmail_service()
-            result = (
+            service = await asyncio.to_thread(self._get_gmail_service)
+            request = (
                 service.users()
                 .messages()
                 .list(userId="me", q=query or "", maxResults=10)
-                .execute()
             )
-            messages = []
-            for item in result.get("messages", []):
-                detail = (
-                    service.users()
-                    .messages()
-                    .get(
-                        userId="me",
-                        id=item["id"],
-                        format="metadata",
-                        metadataHeaders=["From", "Subject"],
-                    )
-                    .execute()
-                )
-                headers = {h["name"]: h["value"] for h in detail.get("payload", {}).get("headers", [])}
+            result = await asyncio.to_thread(request.execute)
+            items = result.get("messages", [])
+            messages: List[Dict[str, str]] = []
+            errors: List[str] = []
+
+            def _collect(request_id, detail, exception) -> None:
+                if exception is not None:
+                    errors.append(str(exception))
+                    return
+                headers = {
+                    h["name"]: h["value"]
+                    for h in detail.get("payload", {}).get("headers", [])
+                }
                 messages.append(
                     {
-                        "id": item["id"],
+                        "id": detail.get("id", ""),
                         "from": headers.get("From", ""),
                         "subject": headers.get("Subject", ""),
                         "snippet": detail.get("snippet", ""),
                     }
                 )
-            return {"emails": messages, "query": query or ""}
+
+            if items:
+                batch = service.new_batch_http_request()
+                for item in items:
+                    batch.add(
+                        service.users()
+                        .messages()
+                        .get(
+                            userId="me",
+                            id=item["id"],
+                            format="metadata",
+                            metadataHeaders=["From", "Subject"],
+                        ),
+                        callback=_collect,
+                    )
+                await asyncio.to_thread(batch.execute)
+            response = {"emails": messages, "query": query or ""}
+            if errors:
+                response["error"] = "Gmail API error."
+                response["detail"] = "; ".join(errors)
+            return response
         except HttpError as exc:
             return {"emails": [], "error": "Gmail API error.", "detail": str(exc)}